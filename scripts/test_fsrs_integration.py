@@ -45,7 +45,7 @@ def test_fsrs_service():
 
     # Test 3: Convert dict back to card
     print("\n3. Converting dict back to card...")
-    restored_card = service.dict_to_card(card_dict)
+    restored_card = service.dict_to_card(card_dict, card_id=1)
     print(f"   OK Restored card")
     print(f"   State: {restored_card.state.name}")
     print(f"   Step: {restored_card.step}")
@@ -102,7 +102,7 @@ def test_fsrs_service():
         "last_review": None,
         "due": datetime.now(UTC),
     }
-    converted_card = service.dict_to_card(new_card_dict)
+    converted_card = service.dict_to_card(new_card_dict, card_id=2)
     print(f"   OK Converted state=0 to FSRS card")
     print(f"   State: {converted_card.state.name} (should be Learning)")
     print(f"   Step: {converted_card.step}")
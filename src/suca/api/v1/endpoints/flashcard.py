@@ -4,7 +4,7 @@ import csv
 import io
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
@@ -41,6 +41,10 @@ def get_flashcard_service(session: Session = Depends(get_session)) -> FlashcardS
     return FlashcardService(session)
 
 
+# Limits for GET /decks/batch; deck IDs are INTEGER primary keys
+MAX_BATCH_DECK_IDS = 100
+MAX_DECK_ID = 2**31 - 1
+
 # Type aliases for dependencies
 UserIdDep = Annotated[str, Depends(get_current_user_id)]
 FlashcardServiceDep = Annotated[FlashcardService, Depends(get_flashcard_service)]
@@ -71,6 +75,30 @@ def create_flashcard_deck(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Declared before /decks/{deck_id} so "batch" is not parsed as a deck ID
+@router.get("/decks/batch", response_model=DeckListResponse)
+def get_flashcard_decks_batch(
+    user_id: UserIdDep,
+    flashcard_service: FlashcardServiceDep,
+    ids: str = Query(
+        ..., description="Comma-separated deck IDs (max 100)", pattern=r"^\d{1,10}(,\d{1,10})*$"
+    ),
+) -> DeckListResponse:
+    """Get several decks in one request. Requires authentication."""
+    deck_ids = [int(deck_id) for deck_id in ids.split(",")]
+    if len(deck_ids) > MAX_BATCH_DECK_IDS:
+        raise HTTPException(
+            status_code=422, detail=f"At most {MAX_BATCH_DECK_IDS} deck IDs per request"
+        )
+    if any(deck_id > MAX_DECK_ID for deck_id in deck_ids):
+        raise HTTPException(status_code=422, detail="Deck ID out of range")
+
+    try:
+        return flashcard_service.get_decks_by_ids(deck_ids, user_id)
+    except DatabaseException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/decks/{deck_id}", response_model=DeckResponse)
 def get_flashcard_deck(
     deck_id: int, user_id: UserIdDep, flashcard_service: FlashcardServiceDep
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -57,6 +58,8 @@ app = FastAPI(
     description=settings.api_description,
     lifespan=lifespan,
     debug=settings.debug,
+    # Serialize JSON responses with orjson
+    default_response_class=ORJSONResponse,
     # Enhanced documentation
     docs_url="/docs",
     redoc_url="/redoc",
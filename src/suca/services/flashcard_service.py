@@ -1,8 +1,10 @@
 """Flashcard service for business logic."""
 
+from collections import Counter
 from datetime import UTC, datetime
 
 from fsrs import Rating
+from sqlalchemy import insert, literal
 from sqlmodel import func, select
 
 from ..core.exceptions import DatabaseException, ValidationException
@@ -49,10 +51,10 @@ class FlashcardService(BaseService[Flashcard]):
                 is_public=deck_create.is_public if deck_create.is_public is not None else False,
             )
             self.session.add(deck)
-            self.session.commit()
-            self.session.refresh(deck)
+            self.session.flush()  # Assigns the primary key, so no refresh SELECT is needed
 
-            return DeckResponse(
+            # Build the response before commit expires the instance
+            response = DeckResponse(
                 id=deck.id,
                 user_id=deck.user_id,
                 name=deck.name,
@@ -62,6 +64,9 @@ class FlashcardService(BaseService[Flashcard]):
                 updated_at=deck.updated_at,
                 flashcard_count=0,
             )
+            self.session.commit()
+
+            return response
         except Exception as e:
             self.session.rollback()
             raise DatabaseException(f"Failed to create deck: {str(e)}")
@@ -97,6 +102,37 @@ class FlashcardService(BaseService[Flashcard]):
         except Exception as e:
             raise DatabaseException(f"Failed to get decks: {str(e)}")
 
+    def get_decks_by_ids(self, deck_ids: list[int], user_id: str) -> DeckListResponse:
+        """Get several of the user's decks in one query (unknown or foreign IDs are skipped)."""
+        try:
+            statement = (
+                select(FlashcardDeck, func.count(Flashcard.id).label("flashcard_count"))
+                .outerjoin(Flashcard, FlashcardDeck.id == Flashcard.deck_id)
+                .where(FlashcardDeck.user_id == user_id, FlashcardDeck.id.in_(deck_ids))
+                .group_by(FlashcardDeck.id)
+                .order_by(FlashcardDeck.id)
+            )
+
+            results = self.session.exec(statement).all()
+
+            decks = [
+                DeckResponse(
+                    id=deck.id,
+                    user_id=deck.user_id,
+                    name=deck.name,
+                    description=deck.description,
+                    is_public=deck.is_public,
+                    created_at=deck.created_at,
+                    updated_at=deck.updated_at,
+                    flashcard_count=count,
+                )
+                for deck, count in results
+            ]
+
+            return DeckListResponse(decks=decks, total_count=len(decks))
+        except Exception as e:
+            raise DatabaseException(f"Failed to get decks: {str(e)}")
+
     def get_deck(self, deck_id: int, user_id: str) -> DeckResponse:
         """Get a specific deck."""
         deck = self._get_deck_by_id(deck_id, user_id)
@@ -291,7 +327,7 @@ class FlashcardService(BaseService[Flashcard]):
                 "last_review": flashcard.last_review,
                 "due": flashcard.due,
             }
-            fsrs_card = self.fsrs_service.dict_to_card(card_dict)
+            fsrs_card = self.fsrs_service.dict_to_card(card_dict, flashcard.id)
 
             # Review the card
             rating = Rating(review.rating)
@@ -338,6 +374,9 @@ class FlashcardService(BaseService[Flashcard]):
         """
         try:
             now = datetime.now(UTC)
+            # Naive due dates are stored in UTC; compare them against a naive now instead
+            # of re-attaching tzinfo to every card
+            naive_now = now.replace(tzinfo=None)
 
             # Get all user's decks
             deck_statement = select(FlashcardDeck).where(FlashcardDeck.user_id == user_id)
@@ -352,14 +391,13 @@ class FlashcardService(BaseService[Flashcard]):
                 cards = self.session.exec(card_statement).all()
 
                 total_cards = len(cards)
-                new_cards = sum(1 for c in cards if c.state == CardState.New)
-                learning_cards = sum(1 for c in cards if c.state == CardState.Learning)
-                review_cards = sum(1 for c in cards if c.state == CardState.Review)
-                # Ensure timezone-aware comparison for due date
+                # Tally states in one pass (states are stored as plain ints)
+                state_counts = Counter(c.state for c in cards)
+                new_cards = state_counts[CardState.New]
+                learning_cards = state_counts[CardState.Learning]
+                review_cards = state_counts[CardState.Review]
                 due_cards = sum(
-                    1
-                    for c in cards
-                    if (c.due.replace(tzinfo=UTC) if c.due.tzinfo is None else c.due) <= now
+                    1 for c in cards if c.due <= (naive_now if c.due.tzinfo is None else now)
                 )
 
                 deck_stats.append(
@@ -400,6 +438,7 @@ class FlashcardService(BaseService[Flashcard]):
 
         try:
             now = datetime.now(UTC)
+            naive_now = now.replace(tzinfo=None)  # for naive (UTC) due dates
 
             # Get all cards in the deck that are due
             statement = (
@@ -410,11 +449,11 @@ class FlashcardService(BaseService[Flashcard]):
 
             all_cards = self.session.exec(statement).all()
 
-            # Filter for cards that are due (with timezone-aware comparison)
+            # Filter for cards that are due
             due_cards = [
                 card
                 for card in all_cards
-                if (card.due.replace(tzinfo=UTC) if card.due.tzinfo is None else card.due) <= now
+                if card.due <= (naive_now if card.due.tzinfo is None else now)
             ]
 
             return FlashcardListResponse(
@@ -547,9 +586,6 @@ class FlashcardService(BaseService[Flashcard]):
             # Get source deck (must be public)
             source_deck = self.get_public_deck(source_deck_id)
 
-            # Get source flashcards
-            source_flashcards = self.get_public_deck_flashcards(source_deck_id)
-
             # Create new deck for user
             deck_name = new_name if new_name else f"{source_deck.name} (Copy)"
             new_deck = FlashcardDeck(
@@ -561,20 +597,21 @@ class FlashcardService(BaseService[Flashcard]):
             self.session.add(new_deck)
             self.session.flush()  # Get deck ID without committing
 
-            # Copy flashcards
-            for source_card in source_flashcards.flashcards:
-                new_card = Flashcard(
-                    deck_id=new_deck.id,
-                    user_id=user_id,
-                    front=source_card.front,
-                    back=source_card.back,
-                )
-                self.session.add(new_card)
-
-            self.session.commit()
-            self.session.refresh(new_deck)
+            # Copy flashcards with a single INSERT ... SELECT (FSRS state and
+            # timestamps are filled in from the column defaults)
+            copy_cards = insert(Flashcard).from_select(
+                ["deck_id", "user_id", "front", "back"],
+                select(
+                    literal(new_deck.id),
+                    literal(user_id),
+                    Flashcard.front,
+                    Flashcard.back,
+                ).where(Flashcard.deck_id == source_deck_id),
+            )
+            copied_count = self.session.execute(copy_cards).rowcount
 
-            return DeckResponse(
+            # Build the response before commit expires the instance
+            response = DeckResponse(
                 id=new_deck.id,
                 user_id=new_deck.user_id,
                 name=new_deck.name,
@@ -582,8 +619,11 @@ class FlashcardService(BaseService[Flashcard]):
                 is_public=new_deck.is_public,
                 created_at=new_deck.created_at,
                 updated_at=new_deck.updated_at,
-                flashcard_count=len(source_flashcards.flashcards),
+                flashcard_count=copied_count,
             )
+            self.session.commit()
+
+            return response
         except ValidationException:
             raise
         except Exception as e:
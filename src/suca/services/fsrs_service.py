@@ -5,6 +5,15 @@ from enum import IntEnum
 
 from fsrs import Card, Rating, ReviewLog, Scheduler, State
 
+# card_id for cards that have no flashcard row yet. Passing an explicit id skips
+# Card()'s default id generation, which sleeps 1ms per card to avoid timestamp
+# collisions; stored cards are rebuilt with their flashcard id (see dict_to_card).
+_UNSAVED_CARD_ID = 0
+
+# The scheduler holds only immutable configuration and its derived constants (decay,
+# interval factor), so one instance is shared rather than rebuilt per request.
+_scheduler = Scheduler()
+
 
 class CardState(IntEnum):
     """Card states matching FSRS State enum."""
@@ -20,7 +29,7 @@ class FSRSService:
 
     def __init__(self):
         """Initialize FSRS scheduler with default parameters."""
-        self.scheduler = Scheduler()
+        self.scheduler = _scheduler
 
     def create_card(self) -> Card:
         """
@@ -29,7 +38,7 @@ class FSRSService:
         Returns:
             A new Card object in the Learning state (FSRS default)
         """
-        return Card()
+        return Card(card_id=_UNSAVED_CARD_ID)
 
     def review_card(self, card: Card, rating: Rating) -> tuple[Card, ReviewLog]:
         """
@@ -91,7 +100,7 @@ class FSRSService:
             "due": due,
         }
 
-    def dict_to_card(self, data: dict) -> Card:
+    def dict_to_card(self, data: dict, card_id: int) -> Card:
         """
         Convert dictionary to FSRS Card object.
 
@@ -99,36 +108,40 @@ class FSRSService:
 
         Args:
             data: Dictionary with card fields
+            card_id: ID of the flashcard the fields belong to (tags review logs)
 
         Returns:
             FSRS Card object
         """
-        card = Card()
-        card.difficulty = data.get("difficulty") if data.get("difficulty") != 0.0 else None
-        card.stability = data.get("stability") if data.get("stability") != 0.0 else None
-        card.step = data.get("reps", 0)  # Map reps to step
-
         # Convert state integer to State enum
         # Note: State 0 (New) doesn't exist in FSRS v6.3.0, default to Learning
         state_value = data.get("state", 1)
         if state_value == 0:
             state_value = 1  # Convert New to Learning
-        card.state = State(state_value)
 
         # Ensure timezone-aware datetimes
         last_review = data.get("last_review")
         if last_review is not None and last_review.tzinfo is None:
             # Convert naive datetime to UTC-aware
             last_review = last_review.replace(tzinfo=UTC)
-        card.last_review = last_review
 
         due = data.get("due", datetime.now(UTC))
         if due.tzinfo is None:
             # Convert naive datetime to UTC-aware
             due = due.replace(tzinfo=UTC)
-        card.due = due
 
-        return card
+        # Build the card in one constructor call instead of mutating a default Card
+        difficulty = data.get("difficulty")
+        stability = data.get("stability")
+        return Card(
+            card_id=card_id,
+            state=State(state_value),
+            step=data.get("reps", 0),  # Map reps to step
+            stability=stability if stability != 0.0 else None,
+            difficulty=difficulty if difficulty != 0.0 else None,
+            due=due,
+            last_review=last_review,
+        )
 
     def is_card_new(self, card: Card) -> bool:
         """
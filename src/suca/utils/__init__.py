@@ -1,6 +1,8 @@
 """Utility functions and helpers."""
 
-from .logging import logger, setup_logging
+from logging import Logger
+
+from .logging import setup_logging
 from .text import (
     extract_hiragana,
     extract_kanji,
@@ -18,3 +20,12 @@ __all__ = [
     "extract_katakana",
     "is_japanese_text",
 ]
+
+
+def __getattr__(name: str) -> Logger:
+    """Resolve ``logger`` lazily so importing the package doesn't set up logging."""
+    if name == "logger":
+        from .logging import logger
+
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,25 +10,34 @@ def setup_logging(level: str | None = None) -> logging.Logger:
     """Setup application logging."""
 
     log_level = level or ("DEBUG" if settings.debug else "INFO")
+    level_int = logging.getLevelName(log_level.upper())
 
     # Create logger
     logger = logging.getLogger("suca")
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level_int)
 
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, log_level.upper()))
+    # Add console handler (only once). It has no level of its own, so the logger's
+    # level alone decides what is emitted and repeated calls can change it.
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
 
-    # Create formatter
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
+        # Create formatter
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        handler.setFormatter(formatter)
 
-    # Add handler to logger
-    if not logger.handlers:
         logger.addHandler(handler)
 
     return logger
 
 
-# Global logger instance
-logger = setup_logging()
+# Global logger instance, created lazily on first access (see __getattr__)
+logger: logging.Logger
+
+
+def __getattr__(name: str) -> logging.Logger:
+    """Set up the global ``logger`` the first time it is accessed (PEP 562)."""
+    if name == "logger":
+        global logger
+        logger = setup_logging()
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,16 +2,23 @@
 
 import re
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def normalize_japanese_text(text: str) -> str:
     """Normalize Japanese text for better matching."""
     if not text:
         return text
 
-    # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text.strip())
+    text = text.strip()
 
-    return text
+    # Already normalized: no double spaces and no whitespace other than " "
+    # (every other whitespace character is non-printable)
+    if "  " not in text and text.isprintable():
+        return text
+
+    # Remove extra whitespace
+    return _WHITESPACE_RE.sub(" ", text)
 
 
 def extract_kanji(text: str) -> list[str]:
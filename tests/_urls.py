@@ -0,0 +1,67 @@
+"""Memoized URL builders for the flashcard API routes used in tests."""
+
+from functools import lru_cache
+
+DECKS_URL = "/api/v1/flashcard/decks"
+DUE_URL = "/api/v1/flashcard/due"
+PUBLIC_DECKS_URL = "/api/v1/flashcard/public/decks"
+
+
+@lru_cache(maxsize=1024)
+def deck_url(deck_id: int) -> str:
+    """URL of a single deck."""
+    return f"{DECKS_URL}/{deck_id}"
+
+
+@lru_cache(maxsize=1024)
+def cards_url(deck_id: int) -> str:
+    """URL of a deck's flashcard collection."""
+    return f"{DECKS_URL}/{deck_id}/cards"
+
+
+@lru_cache(maxsize=2048)
+def card_url(deck_id: int, card_id: int) -> str:
+    """URL of a single flashcard within a deck."""
+    return f"{DECKS_URL}/{deck_id}/cards/{card_id}"
+
+
+@lru_cache(maxsize=1024)
+def review_url(deck_id: int, card_id: int) -> str:
+    """URL for reviewing a single flashcard."""
+    return f"{DECKS_URL}/{deck_id}/cards/{card_id}/review"
+
+
+@lru_cache(maxsize=1024)
+def deck_due_url(deck_id: int) -> str:
+    """URL of a deck's due flashcards."""
+    return f"{DECKS_URL}/{deck_id}/due"
+
+
+@lru_cache(maxsize=1024)
+def copy_url(deck_id: int) -> str:
+    """URL for copying a deck into the current user's account."""
+    return f"{DECKS_URL}/{deck_id}/copy"
+
+
+@lru_cache(maxsize=1024)
+def export_csv_url(deck_id: int) -> str:
+    """URL for exporting a deck as CSV."""
+    return f"{DECKS_URL}/{deck_id}/export/csv"
+
+
+@lru_cache(maxsize=1024)
+def import_csv_url(deck_id: int) -> str:
+    """URL for importing CSV flashcards into a deck."""
+    return f"{DECKS_URL}/{deck_id}/import/csv"
+
+
+@lru_cache(maxsize=1024)
+def public_deck_url(deck_id: int) -> str:
+    """URL of a single public deck."""
+    return f"{PUBLIC_DECKS_URL}/{deck_id}"
+
+
+@lru_cache(maxsize=1024)
+def public_cards_url(deck_id: int) -> str:
+    """URL of a public deck's flashcard collection."""
+    return f"{PUBLIC_DECKS_URL}/{deck_id}/cards"
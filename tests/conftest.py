@@ -1,53 +1,226 @@
 """Test configuration and fixtures."""
 
+import os
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import delete, event, insert
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
 from src.suca.api.deps import get_session
 from src.suca.core.auth import create_access_token
 from src.suca.db.db import set_engine
+from src.suca.db.model import Flashcard, FlashcardDeck
 from src.suca.main import app
+from src.suca.schemas.flashcard_schemas import DeckCreate, FlashcardResponse
+from src.suca.services.flashcard_service import FlashcardService
+from src.suca.services.fsrs_service import FSRSService
 
 
-@pytest.fixture(name="session", scope="function")
-def session_fixture():
-    """Create a test database session."""
-    # Create test engine
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Mark every test that talks to the app through a TestClient as integration.
+
+    A bare ``pytest`` run (default testpaths, no ``-m``) deselects them; naming
+    test files/directories or passing any ``-m`` expression runs what was asked for.
+    """
+    for item in items:
+        if {"client", "auth_client"} & set(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.integration)
+
+    if config.args_source != pytest.Config.ArgsSource.TESTPATHS or _has_mark_filter(config):
+        return
+
+    deselected = [item for item in items if item.get_closest_marker("integration")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not item.get_closest_marker("integration")]
+
+
+def _has_mark_filter(config: pytest.Config) -> bool:
+    """Return True if ``-m`` was given on the command line (including ``-m ""``)."""
+    return bool(config.option.markexpr) or any(
+        arg.startswith("-m") for arg in config.invocation_params.args
+    )
+
+
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture():
+    """Create the test database engine and schema once per test session.
+
+    Under ``pytest -n auto`` every xdist worker is its own process and therefore
+    gets its own in-memory database; the worker id only namespaces engine logs.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
     test_engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        echo=False,
+        logging_name=f"test-{worker_id}",
     )
 
-    # Set as global engine for this test
+    # pysqlite defers BEGIN until the first DML statement, which breaks SAVEPOINT
+    # handling. Let SQLAlchemy emit BEGIN itself (see SQLAlchemy's SQLite dialect docs).
+    @event.listens_for(test_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    # Keep temporary tables/indices (sorts, GROUP BY) in memory instead of temp files
+    @event.listens_for(test_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(test_engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    # Set as global engine for the test session
     set_engine(test_engine)
 
     # Create tables
     SQLModel.metadata.create_all(test_engine)
 
-    with Session(test_engine) as session:
-        yield session
+    yield test_engine
 
     # Clean up
     SQLModel.metadata.drop_all(test_engine)
+    test_engine.dispose()
 
 
-@pytest.fixture(name="client")
-def client_fixture(session: Session):
-    """Create a test client with test database."""
+@pytest.fixture(name="session", scope="function")
+def session_fixture(engine: Engine):
+    """Create a test database session whose changes are rolled back after the test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    # Commits inside the test (including those made by services) only release a
+    # SAVEPOINT; the outer transaction is rolled back at teardown. The app receives
+    # this session through the get_session override, so keep Session's default
+    # autoflush/expire_on_commit behaviour to match production.
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(name="current_session", scope="session")
+def current_session_fixture(engine: Engine):
+    """Install the get_session override once and return the slot it reads from.
+
+    Tests swap their transactional session in and out of the slot instead of
+    re-assigning ``app.dependency_overrides`` every time.
+    """
+    slot: dict[str, Session] = {}
 
-    def get_session_override():
-        return session
+    def get_session_override() -> Generator[Session, None, None]:
+        if "session" not in slot:
+            yield from get_session()
+            return
+        # Mirror get_session's generator shape, but hand out the test's transactional
+        # session (and leave closing it to the session fixture)
+        yield slot["session"]
 
     app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+    yield slot
+    app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.fixture(name="make_cards")
+def make_cards_fixture(session: Session):
+    """Return a helper that inserts flashcards with a single commit, skipping HTTP.
+
+    Cards are dicts of Flashcard fields; FSRS fields not given start from a new
+    card's state, as in create_flashcard.
+    """
+    fsrs_service = FSRSService()
+    fsrs_data = fsrs_service.card_to_dict(fsrs_service.create_card())
+
+    def make(
+        deck_id: int, cards: list[dict], user_id: str = "demo_user"
+    ) -> list[FlashcardResponse]:
+        rows = [
+            Flashcard(deck_id=deck_id, user_id=user_id, **{**fsrs_data, **card}) for card in cards
+        ]
+        session.add_all(rows)
+        session.commit()
+        return [FlashcardResponse.model_validate(row) for row in rows]
+
+    return make
+
+
+@pytest.fixture(name="seed_deck_with_cards")
+def seed_deck_with_cards_fixture(session: Session, make_cards):
+    """Return a helper that inserts a deck and its flashcards in a single commit."""
 
+    def seed(user_id: str, deck_kwargs: dict, cards: list[dict]) -> int:
+        deck = FlashcardDeck(user_id=user_id, **deck_kwargs)
+        session.add(deck)
+        session.flush()  # Assigns deck.id without committing
+        deck_id = deck.id
+        make_cards(deck_id, cards, user_id=user_id)
+        return deck_id
 
-@pytest.fixture(name="auth_headers")
+    return seed
+
+
+@pytest.fixture(name="seed_committed_decks", scope="session")
+def seed_committed_decks_fixture(engine: Engine):
+    """Return a context manager that seeds decks for a whole module of read-only tests.
+
+    The rows are committed outside the per-test transaction, so they survive
+    each test's rollback and are deleted when the context exits. Cards start
+    from a new card's FSRS state, as in make_cards; tests using the seeded
+    rows must not modify them.
+    """
+    fsrs_service = FSRSService()
+    fsrs_data = fsrs_service.card_to_dict(fsrs_service.create_card())
+
+    @contextmanager
+    def seed(user_id: str, decks: dict[str, tuple[dict, list[dict]]]) -> Iterator[dict[str, int]]:
+        with engine.begin() as connection:
+            deck_ids = {
+                key: connection.execute(
+                    insert(FlashcardDeck).values(user_id=user_id, **deck_kwargs)
+                ).inserted_primary_key[0]
+                for key, (deck_kwargs, _cards) in decks.items()
+            }
+            rows = [
+                {"deck_id": deck_ids[key], "user_id": user_id, **fsrs_data, **card}
+                for key, (_deck_kwargs, cards) in decks.items()
+                for card in cards
+            ]
+            if rows:
+                connection.execute(insert(Flashcard), rows)
+
+        try:
+            yield deck_ids
+        finally:
+            ids = list(deck_ids.values())
+            with engine.begin() as connection:
+                connection.execute(delete(Flashcard).where(Flashcard.deck_id.in_(ids)))
+                connection.execute(delete(FlashcardDeck).where(FlashcardDeck.id.in_(ids)))
+
+    return seed
+
+
+@pytest.fixture(name="session_override")
+def session_override_fixture(session: Session, current_session: dict[str, Session]):
+    """Point the app's get_session dependency at the test's transactional session."""
+    current_session["session"] = session
+    yield session
+    current_session.pop("session", None)
+
+
+@pytest.fixture(name="auth_headers", scope="session")
 def auth_headers_fixture():
     """Create authentication headers for testing."""
     # Create test token for demo_user
@@ -55,9 +228,64 @@ def auth_headers_fixture():
     return {"Authorization": f"Bearer {access_token}"}
 
 
+@pytest.fixture(name="app_client", scope="session")
+def app_client_fixture(engine: Engine):
+    """Start the app once and share an unauthenticated client across the test session."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(name="auth_app_client", scope="session")
+def auth_app_client_fixture(engine: Engine, auth_headers: dict):
+    """Start the app once and share an authenticated client across the test session."""
+    with TestClient(app, headers=auth_headers) as client:
+        yield client
+
+
+@pytest.fixture(name="client")
+def client_fixture(app_client: TestClient, session_override: Session):
+    """Create a test client with test database."""
+    return app_client
+
+
 @pytest.fixture(name="auth_client")
-def auth_client_fixture(client: TestClient, auth_headers: dict):
+def auth_client_fixture(auth_app_client: TestClient, session_override: Session):
     """Create an authenticated test client."""
-    # Store headers in client for convenience
-    client.headers.update(auth_headers)
-    return client
+    return auth_app_client
+
+
+@pytest.fixture(name="deck_id_factory")
+def deck_id_factory_fixture(session: Session):
+    """Return a helper that creates decks through FlashcardService, skipping HTTP."""
+    service = FlashcardService(session)
+
+    def make(name: str = "Test Deck", user_id: str = "demo_user") -> int:
+        return service.create_deck(user_id, DeckCreate(name=name)).id
+
+    return make
+
+
+@pytest.fixture(name="deck_id")
+def deck_id_fixture(deck_id_factory) -> int:
+    """Create a "Test Deck" for demo_user and return its id."""
+    return deck_id_factory()
+
+
+@pytest.fixture(name="card_id")
+def card_id_fixture(deck_id: int, make_cards) -> int:
+    """Create a flashcard in the deck_id deck and return its id."""
+    [card] = make_cards(deck_id, [{"front": "行く", "back": "to go"}])
+    return card.id
+
+
+@pytest.fixture(name="two_decks_with_card")
+def two_decks_with_card_fixture(deck_id_factory, make_cards) -> tuple[int, int, int]:
+    """Create two decks and a flashcard in the first one (for cross-deck tests).
+
+    Returns:
+        Tuple of (deck1_id, deck2_id, card_id)
+    """
+    deck1_id = deck_id_factory("Deck 1")
+    deck2_id = deck_id_factory("Deck 2")
+    [card] = make_cards(deck1_id, [{"front": "Test", "back": "Test"}])
+    return deck1_id, deck2_id, card.id
@@ -1,14 +1,17 @@
 """Tests for CSV import/export functionality."""
 
+import csv
 import io
 
 from fastapi.testclient import TestClient
 
+from tests._urls import DECKS_URL, cards_url, export_csv_url, import_csv_url
+
 
 def test_export_deck_csv(auth_client: TestClient):
     """Test exporting a deck to CSV format."""
     # Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Export Deck"})
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Test Export Deck"})
     assert deck_response.status_code == 201
     deck_id = deck_response.json()["id"]
 
@@ -20,11 +23,11 @@ def test_export_deck_csv(auth_client: TestClient):
     ]
 
     for card in flashcards:
-        response = auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/cards", json=card)
+        response = auth_client.post(cards_url(deck_id), json=card)
         assert response.status_code == 201
 
     # Export to CSV
-    response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/export/csv")
+    response = auth_client.get(export_csv_url(deck_id))
 
     assert response.status_code == 200
     assert response.headers["content-type"] == "text/csv; charset=utf-8"
@@ -32,46 +35,44 @@ def test_export_deck_csv(auth_client: TestClient):
 
     # Parse CSV content
     content = response.content.decode("utf-8-sig")
-    lines = [line.strip() for line in content.strip().split("\n")]
+    rows = list(csv.reader(io.StringIO(content)))
 
     # Check header
-    assert lines[0] == "front,back"
+    assert rows[0] == ["front", "back"]
 
     # Check data rows
-    assert len(lines) == 4  # header + 3 cards
-    assert "Hello" in content
-    assert "こんにちは" in content
+    assert len(rows) == 4  # header + 3 cards
+    assert ["Hello", "こんにちは"] in rows
 
 
 def test_export_empty_deck(auth_client: TestClient):
     """Test exporting an empty deck."""
     # Create an empty deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Empty Deck"})
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Empty Deck"})
     assert deck_response.status_code == 201
     deck_id = deck_response.json()["id"]
 
     # Export to CSV
-    response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/export/csv")
+    response = auth_client.get(export_csv_url(deck_id))
 
     assert response.status_code == 200
     content = response.content.decode("utf-8-sig")
-    lines = content.strip().split("\n")
+    rows = list(csv.reader(io.StringIO(content)))
 
     # Should only have header
-    assert len(lines) == 1
-    assert lines[0] == "front,back"
+    assert rows == [["front", "back"]]
 
 
 def test_export_nonexistent_deck(auth_client: TestClient):
     """Test exporting a deck that doesn't exist."""
-    response = auth_client.get("/api/v1/flashcard/decks/99999/export/csv")
+    response = auth_client.get(export_csv_url(99999))
     assert response.status_code == 404
 
 
 def test_import_deck_csv(auth_client: TestClient):
     """Test importing flashcards from CSV."""
     # Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Import Deck"})
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Test Import Deck"})
     assert deck_response.status_code == 201
     deck_id = deck_response.json()["id"]
 
@@ -84,7 +85,7 @@ Orange,オレンジ
 
     # Upload CSV
     files = {"file": ("test.csv", io.BytesIO(csv_content.encode("utf-8")), "text/csv")}
-    response = auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/import/csv", files=files)
+    response = auth_client.post(import_csv_url(deck_id), files=files)
 
     assert response.status_code == 200
     data = response.json()
@@ -93,7 +94,7 @@ Orange,オレンジ
     assert data["skipped_count"] == 0
 
     # Verify cards were created
-    cards_response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/cards")
+    cards_response = auth_client.get(cards_url(deck_id))
     assert cards_response.status_code == 200
     cards = cards_response.json()["flashcards"]
     assert len(cards) == 3
@@ -102,9 +103,7 @@ Orange,オレンジ
 def test_import_csv_with_empty_rows(auth_client: TestClient):
     """Test importing CSV with empty rows (should be skipped)."""
     # Create a deck
-    deck_response = auth_client.post(
-        "/api/v1/flashcard/decks", json={"name": "Test Import with Empties"}
-    )
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Test Import with Empties"})
     deck_id = deck_response.json()["id"]
 
     # CSV with empty rows
@@ -117,7 +116,7 @@ Mouse,ねずみ
 """
 
     files = {"file": ("test.csv", io.BytesIO(csv_content.encode("utf-8")), "text/csv")}
-    response = auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/import/csv", files=files)
+    response = auth_client.post(import_csv_url(deck_id), files=files)
 
     assert response.status_code == 200
     data = response.json()
@@ -128,7 +127,7 @@ Mouse,ねずみ
 def test_import_csv_invalid_format(auth_client: TestClient):
     """Test importing CSV with invalid format."""
     # Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Invalid CSV"})
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Test Invalid CSV"})
     deck_id = deck_response.json()["id"]
 
     # Invalid CSV (missing required columns)
@@ -137,21 +136,22 @@ Apple,りんご
 """
 
     files = {"file": ("test.csv", io.BytesIO(csv_content.encode("utf-8")), "text/csv")}
-    response = auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/import/csv", files=files)
+    response = auth_client.post(import_csv_url(deck_id), files=files)
 
     assert response.status_code == 400
-    assert "front" in response.json()["detail"] or "back" in response.json()["detail"]
+    detail = response.json()["detail"]
+    assert "front" in detail or "back" in detail
 
 
 def test_import_non_csv_file(auth_client: TestClient):
     """Test importing a non-CSV file."""
     # Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Non-CSV"})
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Test Non-CSV"})
     deck_id = deck_response.json()["id"]
 
     # Non-CSV file
     files = {"file": ("test.txt", io.BytesIO(b"Not a CSV file"), "text/plain")}
-    response = auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/import/csv", files=files)
+    response = auth_client.post(import_csv_url(deck_id), files=files)
 
     assert response.status_code == 400
     assert "CSV" in response.json()["detail"]
@@ -160,7 +160,7 @@ def test_import_non_csv_file(auth_client: TestClient):
 def test_import_csv_with_utf8_bom(auth_client: TestClient):
     """Test importing CSV with UTF-8 BOM (Excel format)."""
     # Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test UTF-8 BOM"})
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Test UTF-8 BOM"})
     deck_id = deck_response.json()["id"]
 
     # CSV with UTF-8 BOM
@@ -171,7 +171,7 @@ Fire,火
     csv_bytes = b"\xef\xbb\xbf" + csv_content.encode("utf-8")  # Add BOM
 
     files = {"file": ("test.csv", io.BytesIO(csv_bytes), "text/csv")}
-    response = auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/import/csv", files=files)
+    response = auth_client.post(import_csv_url(deck_id), files=files)
 
     assert response.status_code == 200
     data = response.json()
@@ -181,7 +181,7 @@ Fire,火
 def test_roundtrip_export_import(auth_client: TestClient):
     """Test exporting a deck and importing it into another deck."""
     # Create first deck with cards
-    deck1_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Source Deck"})
+    deck1_response = auth_client.post(DECKS_URL, json={"name": "Source Deck"})
     deck1_id = deck1_response.json()["id"]
 
     cards = [
@@ -191,29 +191,27 @@ def test_roundtrip_export_import(auth_client: TestClient):
     ]
 
     for card in cards:
-        auth_client.post(f"/api/v1/flashcard/decks/{deck1_id}/cards", json=card)
+        auth_client.post(cards_url(deck1_id), json=card)
 
     # Export deck1
-    export_response = auth_client.get(f"/api/v1/flashcard/decks/{deck1_id}/export/csv")
+    export_response = auth_client.get(export_csv_url(deck1_id))
     assert export_response.status_code == 200
     csv_content = export_response.content
 
     # Create second deck
-    deck2_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Target Deck"})
+    deck2_response = auth_client.post(DECKS_URL, json={"name": "Target Deck"})
     deck2_id = deck2_response.json()["id"]
 
     # Import into deck2
     files = {"file": ("exported.csv", io.BytesIO(csv_content), "text/csv")}
-    import_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck2_id}/import/csv", files=files
-    )
+    import_response = auth_client.post(import_csv_url(deck2_id), files=files)
 
     assert import_response.status_code == 200
     assert import_response.json()["imported_count"] == 3
 
     # Verify both decks have same cards
-    deck1_cards = auth_client.get(f"/api/v1/flashcard/decks/{deck1_id}/cards").json()
-    deck2_cards = auth_client.get(f"/api/v1/flashcard/decks/{deck2_id}/cards").json()
+    deck1_cards = auth_client.get(cards_url(deck1_id)).json()
+    deck2_cards = auth_client.get(cards_url(deck2_id)).json()
 
     assert len(deck1_cards["flashcards"]) == len(deck2_cards["flashcards"])
 
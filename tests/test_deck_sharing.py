@@ -1,18 +1,45 @@
 """Tests for deck sharing functionality."""
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
-from src.suca.db.model import Flashcard, FlashcardDeck
+from src.suca.db.model import FlashcardDeck
+from tests._urls import (
+    DECKS_URL,
+    PUBLIC_DECKS_URL,
+    copy_url,
+    deck_url,
+    public_cards_url,
+    public_deck_url,
+)
 
 # Helper to get test user ID
 TEST_USER_ID = "demo_user"
 
 
+@pytest.fixture(name="seeded_public_decks", scope="module")
+def seeded_public_decks_fixture(seed_committed_decks):
+    """Seed another user's public and private decks for the read-only tests in this module."""
+    decks = {
+        "public1_id": (
+            {"name": "Public Deck 1", "description": "First public deck", "is_public": True},
+            [{"front": "Hola", "back": "Hello"}, {"front": "Adiós", "back": "Goodbye"}],
+        ),
+        "public2_id": (
+            {"name": "Public Deck 2", "description": "Second public deck", "is_public": True},
+            [],
+        ),
+        "private_id": ({"name": "Private Deck", "is_public": False}, []),
+    }
+    with seed_committed_decks("other_user_id", decks) as deck_ids:
+        yield deck_ids
+
+
 def test_create_public_deck(auth_client: TestClient):
     """Test creating a public deck."""
     response = auth_client.post(
-        "/api/v1/flashcard/decks",
+        DECKS_URL,
         json={
             "name": "Public Spanish Deck",
             "description": "Basic Spanish vocabulary for beginners",
@@ -32,12 +59,13 @@ def test_update_deck_to_public(auth_client: TestClient, session: Session):
     # Create a private deck first
     deck = FlashcardDeck(user_id=TEST_USER_ID, name="Test Deck", is_public=False)
     session.add(deck)
+    session.flush()
+    deck_id = deck.id
     session.commit()
-    session.refresh(deck)
 
     # Make deck public
     response = auth_client.patch(
-        f"/api/v1/flashcard/decks/{deck.id}",
+        deck_url(deck_id),
         json={"is_public": True, "description": "Shared with the community"},
     )
 
@@ -47,31 +75,10 @@ def test_update_deck_to_public(auth_client: TestClient, session: Session):
     assert data["description"] == "Shared with the community"
 
 
-def test_list_public_decks_no_auth(client: TestClient, session: Session):
+def test_list_public_decks_no_auth(client: TestClient, seeded_public_decks: dict):
     """Test listing public decks without authentication."""
-    # Create some public and private decks
-    public_deck1 = FlashcardDeck(
-        user_id=TEST_USER_ID,
-        name="Public Deck 1",
-        description="First public deck",
-        is_public=True,
-    )
-    public_deck2 = FlashcardDeck(
-        user_id=TEST_USER_ID,
-        name="Public Deck 2",
-        description="Second public deck",
-        is_public=True,
-    )
-    private_deck = FlashcardDeck(
-        user_id=TEST_USER_ID,
-        name="Private Deck",
-        is_public=False,
-    )
-    session.add_all([public_deck1, public_deck2, private_deck])
-    session.commit()
-
     # List public decks without auth
-    response = client.get("/api/v1/flashcard/public/decks")
+    response = client.get(PUBLIC_DECKS_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -84,77 +91,36 @@ def test_list_public_decks_no_auth(client: TestClient, session: Session):
     assert "Private Deck" not in deck_names
 
 
-def test_get_public_deck_no_auth(client: TestClient, session: Session):
+def test_get_public_deck_no_auth(client: TestClient, seeded_public_decks: dict):
     """Test getting a public deck without authentication."""
-    # Create a public deck
-    public_deck = FlashcardDeck(
-        user_id=TEST_USER_ID,
-        name="Spanish Basics",
-        description="Learn Spanish basics",
-        is_public=True,
-    )
-    session.add(public_deck)
-    session.commit()
-    session.refresh(public_deck)
+    public_deck_id = seeded_public_decks["public1_id"]
 
     # Get public deck without auth
-    response = client.get(f"/api/v1/flashcard/public/decks/{public_deck.id}")
+    response = client.get(public_deck_url(public_deck_id))
 
     assert response.status_code == 200
     data = response.json()
-    assert data["name"] == "Spanish Basics"
-    assert data["description"] == "Learn Spanish basics"
+    assert data["name"] == "Public Deck 1"
+    assert data["description"] == "First public deck"
     assert data["is_public"] is True
 
 
-def test_get_private_deck_as_public_fails(client: TestClient, session: Session):
+def test_get_private_deck_as_public_fails(client: TestClient, seeded_public_decks: dict):
     """Test that private decks cannot be accessed via public endpoint."""
-    # Create a private deck
-    private_deck = FlashcardDeck(
-        user_id=TEST_USER_ID,
-        name="Private Deck",
-        is_public=False,
-    )
-    session.add(private_deck)
-    session.commit()
-    session.refresh(private_deck)
+    private_deck_id = seeded_public_decks["private_id"]
 
     # Try to get private deck via public endpoint
-    response = client.get(f"/api/v1/flashcard/public/decks/{private_deck.id}")
+    response = client.get(public_deck_url(private_deck_id))
 
     assert response.status_code == 404
 
 
-def test_get_public_deck_flashcards_no_auth(client: TestClient, session: Session):
+def test_get_public_deck_flashcards_no_auth(client: TestClient, seeded_public_decks: dict):
     """Test getting flashcards from a public deck without authentication."""
-    # Create a public deck with flashcards
-    public_deck = FlashcardDeck(
-        user_id=TEST_USER_ID,
-        name="Spanish Basics",
-        is_public=True,
-    )
-    session.add(public_deck)
-    session.commit()
-    session.refresh(public_deck)
-
-    # Add flashcards
-    flashcard1 = Flashcard(
-        deck_id=public_deck.id,
-        user_id=TEST_USER_ID,
-        front="Hola",
-        back="Hello",
-    )
-    flashcard2 = Flashcard(
-        deck_id=public_deck.id,
-        user_id=TEST_USER_ID,
-        front="Adiós",
-        back="Goodbye",
-    )
-    session.add_all([flashcard1, flashcard2])
-    session.commit()
+    public_deck_id = seeded_public_decks["public1_id"]
 
     # Get flashcards without auth
-    response = client.get(f"/api/v1/flashcard/public/decks/{public_deck.id}/cards")
+    response = client.get(public_cards_url(public_deck_id))
 
     assert response.status_code == 200
     data = response.json()
@@ -166,37 +132,17 @@ def test_get_public_deck_flashcards_no_auth(client: TestClient, session: Session
     assert "Adiós" in fronts
 
 
-def test_copy_public_deck(auth_client: TestClient, session: Session):
+def test_copy_public_deck(auth_client: TestClient, seed_deck_with_cards):
     """Test copying a public deck to user's collection."""
-    # Create a public deck with flashcards
-    public_deck = FlashcardDeck(
-        user_id="other_user_id",  # Different user
-        name="Spanish Basics",
-        description="Community shared deck",
-        is_public=True,
+    # Create a public deck with flashcards, owned by a different user
+    public_deck_id = seed_deck_with_cards(
+        "other_user_id",
+        {"name": "Spanish Basics", "description": "Community shared deck", "is_public": True},
+        [{"front": "Hola", "back": "Hello"}, {"front": "Gracias", "back": "Thank you"}],
     )
-    session.add(public_deck)
-    session.commit()
-    session.refresh(public_deck)
-
-    # Add flashcards
-    flashcard1 = Flashcard(
-        deck_id=public_deck.id,
-        user_id="other_user_id",
-        front="Hola",
-        back="Hello",
-    )
-    flashcard2 = Flashcard(
-        deck_id=public_deck.id,
-        user_id="other_user_id",
-        front="Gracias",
-        back="Thank you",
-    )
-    session.add_all([flashcard1, flashcard2])
-    session.commit()
 
     # Copy deck to current user
-    response = auth_client.post(f"/api/v1/flashcard/decks/{public_deck.id}/copy")
+    response = auth_client.post(copy_url(public_deck_id))
 
     assert response.status_code == 200
     data = response.json()
@@ -207,22 +153,15 @@ def test_copy_public_deck(auth_client: TestClient, session: Session):
     assert data["flashcard_count"] == 2
 
 
-def test_copy_public_deck_with_custom_name(auth_client: TestClient, session: Session):
+def test_copy_public_deck_with_custom_name(auth_client: TestClient, seed_deck_with_cards):
     """Test copying a public deck with a custom name."""
     # Create a public deck
-    public_deck = FlashcardDeck(
-        user_id="other_user_id",
-        name="Spanish Basics",
-        is_public=True,
+    public_deck_id = seed_deck_with_cards(
+        "other_user_id", {"name": "Spanish Basics", "is_public": True}, []
     )
-    session.add(public_deck)
-    session.commit()
-    session.refresh(public_deck)
 
     # Copy with custom name
-    response = auth_client.post(
-        f"/api/v1/flashcard/decks/{public_deck.id}/copy?new_name=My Spanish Deck"
-    )
+    response = auth_client.post(copy_url(public_deck_id), params={"new_name": "My Spanish Deck"})
 
     assert response.status_code == 200
     data = response.json()
@@ -238,18 +177,19 @@ def test_copy_private_deck_fails(auth_client: TestClient, session: Session):
         is_public=False,
     )
     session.add(private_deck)
+    session.flush()
+    private_deck_id = private_deck.id
     session.commit()
-    session.refresh(private_deck)
 
     # Try to copy private deck
-    response = auth_client.post(f"/api/v1/flashcard/decks/{private_deck.id}/copy")
+    response = auth_client.post(copy_url(private_deck_id))
 
     assert response.status_code == 404
 
 
 def test_copy_nonexistent_deck_fails(auth_client: TestClient):
     """Test that copying a nonexistent deck fails."""
-    response = auth_client.post("/api/v1/flashcard/decks/99999/copy")
+    response = auth_client.post(copy_url(99999))
 
     assert response.status_code == 404
 
@@ -263,10 +203,11 @@ def test_copy_deck_requires_auth(client: TestClient, session: Session):
         is_public=True,
     )
     session.add(public_deck)
+    session.flush()
+    public_deck_id = public_deck.id
     session.commit()
-    session.refresh(public_deck)
 
     # Try to copy without auth
-    response = client.post(f"/api/v1/flashcard/decks/{public_deck.id}/copy")
+    response = client.post(copy_url(public_deck_id))
 
     assert response.status_code == 403  # Forbidden (not authenticated)
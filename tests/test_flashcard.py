@@ -2,14 +2,23 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
+
+from src.suca.db.model import Flashcard
+from tests._urls import DECKS_URL, card_url, cards_url, deck_url
+
+# Flashcard text at and just over the 1000-character limit
+_LEN_1000 = "a" * 1000
+_LEN_1001 = "a" * 1001
+
+
+@pytest.fixture(name="seeded_deck", scope="module")
+def seeded_deck_fixture(seed_committed_decks):
+    """Seed one ``demo_user`` deck with two flashcards for read-only tests."""
+    cards = [{"front": "行く", "back": "to go"}, {"front": "食べる", "back": "to eat"}]
+    with seed_committed_decks("demo_user", {"deck": ({"name": "Seeded Deck"}, cards)}) as ids:
+        yield ids["deck"]
 
-from src.suca.core.exceptions import ValidationException
-from src.suca.schemas.flashcard_schemas import (
-    DeckCreate,
-    FlashcardCreate,
-)
-from src.suca.services.flashcard_service import FlashcardService
 
 # ===== Deck Tests =====
 
@@ -17,7 +26,7 @@ from src.suca.services.flashcard_service import FlashcardService
 def test_create_deck(auth_client: TestClient):  # ← Changed
     """Test creating a new deck."""
     response = auth_client.post(  # ← Changed
-        "/api/v1/flashcard/decks", json={"name": "My Test Deck"}
+        DECKS_URL, json={"name": "My Test Deck"}
     )
 
     assert response.status_code == 201
@@ -29,14 +38,10 @@ def test_create_deck(auth_client: TestClient):  # ← Changed
     assert data["flashcard_count"] == 0
 
 
-def test_list_decks(auth_client: TestClient):  # ← Changed
+def test_list_decks(auth_client: TestClient, deck_id: int, seeded_deck: int):  # ← Changed
     """Test listing all decks."""
-    # Create decks
-    auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 1"})
-    auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 2"})
-
     # List decks
-    response = auth_client.get("/api/v1/flashcard/decks")
+    response = auth_client.get(DECKS_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -45,92 +50,56 @@ def test_list_decks(auth_client: TestClient):  # ← Changed
     assert "total_count" in data
     assert data["total_count"] >= 2
     assert len(data["decks"]) >= 2
+    assert {deck_id, seeded_deck} <= {deck["id"] for deck in data["decks"]}
 
 
-def test_get_deck(auth_client: TestClient):  # ← Changed
-    """Test getting a specific deck."""
-    # Create a deck
-    create_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = create_response.json()["id"]
-
-    # Get the deck
-    response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["id"] == deck_id
-    assert data["name"] == "Test Deck"
-    assert data["user_id"] == "demo_user"
-    assert data["flashcard_count"] == 0
-
-
-def test_get_nonexistent_deck(auth_client: TestClient):  # ← Changed
-    """Test getting a deck that doesn't exist."""
-    response = auth_client.get("/api/v1/flashcard/decks/99999")
-    assert response.status_code == 404
-
-
-def test_update_deck(auth_client: TestClient):  # ← Changed
-    """Test updating a deck."""
-    # Create a deck
-    create_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Original Name"})
-    deck_id = create_response.json()["id"]
-
-    # Update the deck
-    update_response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck_id}", json={"name": "Updated Name"}
-    )
-
-    assert update_response.status_code == 200
-    data = update_response.json()
-
-    assert data["id"] == deck_id
-    assert data["name"] == "Updated Name"
-
-
-def test_update_nonexistent_deck(auth_client: TestClient):  # ← Changed
-    """Test updating a deck that doesn't exist."""
-    response = auth_client.put("/api/v1/flashcard/decks/99999", json={"name": "Updated Name"})
-
-    assert response.status_code == 404
-
-
-def test_delete_deck(auth_client: TestClient):  # ← Changed
-    """Test deleting a deck."""
-    # Create a deck
-    create_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck to Delete"})
-    deck_id = create_response.json()["id"]
-
-    # Delete the deck
-    delete_response = auth_client.delete(f"/api/v1/flashcard/decks/{deck_id}")
-
-    assert delete_response.status_code == 204
-
-    # Verify it's deleted
-    get_response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}")
-    assert get_response.status_code == 404
-
-
-def test_delete_nonexistent_deck(auth_client: TestClient):  # ← Changed
-    """Test deleting a deck that doesn't exist."""
-    response = auth_client.delete("/api/v1/flashcard/decks/99999")
+@pytest.mark.parametrize(
+    ("method", "payload", "status", "expected"),
+    [
+        ("get", None, 200, {"name": "Test Deck", "user_id": "demo_user", "flashcard_count": 0}),
+        ("put", {"name": "Updated Name"}, 200, {"name": "Updated Name"}),
+        ("delete", None, 204, None),
+    ],
+    ids=["get", "update", "delete"],
+)
+def test_deck_crud(
+    auth_client: TestClient,
+    deck_id: int,
+    method: str,
+    payload: dict | None,
+    status: int,
+    expected: dict | None,
+):
+    """Test getting, updating and deleting an existing deck."""
+    kwargs = {"json": payload} if payload is not None else {}
+    response = getattr(auth_client, method)(deck_url(deck_id), **kwargs)
+
+    assert response.status_code == status
+    if expected is not None:
+        data = response.json()
+        assert data["id"] == deck_id
+        for field, value in expected.items():
+            assert data[field] == value
+
+
+@pytest.mark.parametrize(
+    ("method", "body"),
+    [("get", None), ("put", {"name": "Updated Name"}), ("delete", None)],
+)
+def test_nonexistent_deck(auth_client: TestClient, method: str, body: dict | None):
+    """Test getting, updating or deleting a deck that doesn't exist."""
+    kwargs = {"json": body} if body is not None else {}
+    response = getattr(auth_client, method)(deck_url(99999), **kwargs)
     assert response.status_code == 404
 
 
 # ===== Flashcard Tests (Nested Routes) =====
 
 
-def test_create_flashcard(auth_client: TestClient):  # ← Changed
+def test_create_flashcard(auth_client: TestClient, deck_id: int):  # ← Changed
     """Test creating a flashcard with nested route."""
-    # Create a deck first
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
     # Create a flashcard (no deck_id in body - comes from URL)
-    response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "行く", "back": "to go"}
-    )
+    response = auth_client.post(cards_url(deck_id), json={"front": "行く", "back": "to go"})
 
     assert response.status_code == 201
     data = response.json()
@@ -144,29 +113,15 @@ def test_create_flashcard(auth_client: TestClient):  # ← Changed
 
 def test_create_flashcard_invalid_deck(auth_client: TestClient):  # ← Changed
     """Test creating a flashcard with non-existent deck."""
-    response = auth_client.post(
-        "/api/v1/flashcard/decks/99999/cards", json={"front": "Test", "back": "Test"}
-    )
+    response = auth_client.post(cards_url(99999), json={"front": "Test", "back": "Test"})
 
     assert response.status_code == 404
 
 
-def test_get_deck_flashcards(auth_client: TestClient):  # ← Changed
+def test_get_deck_flashcards(auth_client: TestClient, seeded_deck: int):  # ← Changed
     """Test getting all flashcards in a deck."""
-    # Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
-    # Create multiple flashcards
-    auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "行く", "back": "to go"}
-    )
-    auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "食べる", "back": "to eat"}
-    )
-
     # Get flashcards
-    response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/cards")
+    response = auth_client.get(cards_url(seeded_deck))
 
     assert response.status_code == 200
     data = response.json()
@@ -177,262 +132,85 @@ def test_get_deck_flashcards(auth_client: TestClient):  # ← Changed
     assert len(data["flashcards"]) == 2
 
 
-def test_get_flashcard(auth_client: TestClient):  # ← Changed
-    """Test getting a specific flashcard."""
-    # Create a deck and flashcard
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "行く", "back": "to go"}
-    )
-    card_id = card_response.json()["id"]
-
-    # Get the flashcard
-    response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/cards/{card_id}")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["id"] == card_id
-    assert data["deck_id"] == deck_id
-    assert data["front"] == "行く"
-    assert data["back"] == "to go"
-
-
-def test_get_flashcard_wrong_deck(auth_client: TestClient):  # ← Changed
-    """Test getting a flashcard from wrong deck returns 404."""
-    # Create two decks
-    deck1_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 1"})
-    deck1_id = deck1_response.json()["id"]
-
-    deck2_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 2"})
-    deck2_id = deck2_response.json()["id"]
-
-    # Create flashcard in deck 1
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck1_id}/cards", json={"front": "Test", "back": "Test"}
-    )
-    card_id = card_response.json()["id"]
-
-    # Try to get flashcard from deck 2 (should fail)
-    response = auth_client.get(f"/api/v1/flashcard/decks/{deck2_id}/cards/{card_id}")
-    assert response.status_code == 404
-
-
-def test_update_flashcard(auth_client: TestClient):  # ← Changed
-    """Test updating a flashcard."""
-    # Create a deck and flashcard
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "Original", "back": "Original"}
-    )
-    card_id = card_response.json()["id"]
-
-    # Update the flashcard
-    update_response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck_id}/cards/{card_id}",
-        json={"front": "Updated Front", "back": "Updated Back"},
-    )
-
-    assert update_response.status_code == 200
-    data = update_response.json()
-
-    assert data["id"] == card_id
-    assert data["front"] == "Updated Front"
-    assert data["back"] == "Updated Back"
-
-
-def test_update_flashcard_partial(auth_client: TestClient):  # ← Changed
-    """Test partial update of a flashcard."""
-    # Create a deck and flashcard
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards",
-        json={"front": "Original Front", "back": "Original Back"},
-    )
-    card_id = card_response.json()["id"]
-
-    # Update only back
-    update_response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck_id}/cards/{card_id}", json={"back": "Updated Back"}
-    )
-
-    assert update_response.status_code == 200
-    data = update_response.json()
-
-    assert data["front"] == "Original Front"  # Unchanged
-    assert data["back"] == "Updated Back"  # Changed
-
-
-def test_update_flashcard_wrong_deck(auth_client: TestClient):  # ← Changed
-    """Test updating a flashcard from wrong deck returns 404."""
-    # Create two decks
-    deck1_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 1"})
-    deck1_id = deck1_response.json()["id"]
-
-    deck2_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 2"})
-    deck2_id = deck2_response.json()["id"]
-
-    # Create flashcard in deck 1
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck1_id}/cards", json={"front": "Test", "back": "Test"}
-    )
-    card_id = card_response.json()["id"]
-
-    # Try to update flashcard via deck 2 (should fail)
-    response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck2_id}/cards/{card_id}", json={"back": "Updated"}
-    )
-    assert response.status_code == 404
-
-
-def test_delete_flashcard(auth_client: TestClient):  # ← Changed
-    """Test deleting a flashcard."""
-    # Create a deck and flashcard
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "Delete Me", "back": "Delete Me"}
-    )
-    card_id = card_response.json()["id"]
-
-    # Delete the flashcard
-    delete_response = auth_client.delete(f"/api/v1/flashcard/decks/{deck_id}/cards/{card_id}")
-
-    assert delete_response.status_code == 204
-
-    # Verify it's deleted
-    get_response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/cards/{card_id}")
-    assert get_response.status_code == 404
-
-
-def test_delete_flashcard_wrong_deck(auth_client: TestClient):  # ← Changed
-    """Test deleting a flashcard from wrong deck returns 404."""
-    # Create two decks
-    deck1_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 1"})
-    deck1_id = deck1_response.json()["id"]
-
-    deck2_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 2"})
-    deck2_id = deck2_response.json()["id"]
-
-    # Create flashcard in deck 1
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck1_id}/cards", json={"front": "Test", "back": "Test"}
-    )
-    card_id = card_response.json()["id"]
-
-    # Try to delete flashcard via deck 2 (should fail)
-    response = auth_client.delete(f"/api/v1/flashcard/decks/{deck2_id}/cards/{card_id}")
+@pytest.mark.parametrize(
+    ("method", "payload", "status", "expected"),
+    [
+        ("get", None, 200, {"front": "行く", "back": "to go"}),
+        (
+            "put",
+            {"front": "Updated Front", "back": "Updated Back"},
+            200,
+            {"front": "Updated Front", "back": "Updated Back"},
+        ),
+        ("put", {"back": "Updated Back"}, 200, {"front": "行く", "back": "Updated Back"}),
+        ("delete", None, 204, None),
+    ],
+    ids=["get", "update", "update_partial", "delete"],
+)
+def test_flashcard_crud(
+    auth_client: TestClient,
+    deck_id: int,
+    card_id: int,
+    method: str,
+    payload: dict | None,
+    status: int,
+    expected: dict | None,
+):
+    """Test getting, updating (fully or partially) and deleting a flashcard."""
+    kwargs = {"json": payload} if payload is not None else {}
+    response = getattr(auth_client, method)(card_url(deck_id, card_id), **kwargs)
+
+    assert response.status_code == status
+    if expected is not None:
+        data = response.json()
+        assert data["id"] == card_id
+        assert data["deck_id"] == deck_id
+        for field, value in expected.items():
+            assert data[field] == value
+
+
+@pytest.mark.parametrize(
+    ("method", "body"),
+    [("get", None), ("put", {"back": "Updated"}), ("delete", None)],
+)
+def test_flashcard_wrong_deck(
+    auth_client: TestClient,
+    two_decks_with_card: tuple[int, int, int],
+    method: str,
+    body: dict | None,
+):
+    """Test accessing a flashcard through the wrong deck returns 404."""
+    _, deck2_id, card_id = two_decks_with_card
+
+    # Try to access the deck 1 flashcard via deck 2 (should fail)
+    kwargs = {"json": body} if body is not None else {}
+    response = getattr(auth_client, method)(card_url(deck2_id, card_id), **kwargs)
     assert response.status_code == 404
 
 
-def test_delete_deck_with_flashcards(auth_client: TestClient):  # ← Changed
+def test_delete_deck_with_flashcards(
+    auth_client: TestClient, session: Session, seed_deck_with_cards
+):
     """Test deleting a deck that contains flashcards (cascade delete)."""
-    # Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck with Cards"})
-    deck_id = deck_response.json()["id"]
-
-    # Add flashcards
-    card1 = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "Card 1", "back": "Card 1"}
-    ).json()
-
-    auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "Card 2", "back": "Card 2"}
+    # Create a deck with flashcards
+    deck_id = seed_deck_with_cards(
+        "demo_user",
+        {"name": "Deck with Cards"},
+        [{"front": "Card 1", "back": "Card 1"}, {"front": "Card 2", "back": "Card 2"}],
     )
 
     # Delete the deck
-    delete_response = auth_client.delete(f"/api/v1/flashcard/decks/{deck_id}")
+    delete_response = auth_client.delete(deck_url(deck_id))
 
     assert delete_response.status_code == 204
 
     # Verify deck is deleted
-    get_deck_response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}")
+    get_deck_response = auth_client.get(deck_url(deck_id))
     assert get_deck_response.status_code == 404
 
     # Verify flashcards are also deleted
-    get_card1_response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/cards/{card1['id']}")
-    assert get_card1_response.status_code == 404
-
-
-# ===== Service Layer Tests =====
-
-
-def test_flashcard_service_create_deck(session: Session):
-    """Test FlashcardService create_deck method."""
-    service = FlashcardService(session)
-
-    deck_create = DeckCreate(name="Service Test Deck")
-    deck = service.create_deck("test_user", deck_create)
-
-    assert deck.id is not None
-    assert deck.name == "Service Test Deck"
-    assert deck.user_id == "test_user"
-    assert deck.flashcard_count == 0
-
-
-def test_flashcard_service_get_deck(session: Session):
-    """Test FlashcardService get_deck method."""
-    service = FlashcardService(session)
-
-    # Create a deck
-    deck_create = DeckCreate(name="Test Deck")
-    created_deck = service.create_deck("test_user", deck_create)
-
-    # Get the deck
-    deck = service.get_deck(created_deck.id, "test_user")
-
-    assert deck.id == created_deck.id
-    assert deck.name == "Test Deck"
-    assert deck.user_id == "test_user"
-
-
-def test_flashcard_service_create_flashcard(session: Session):
-    """Test FlashcardService create_flashcard method."""
-    service = FlashcardService(session)
-
-    # Create a deck first
-    deck_create = DeckCreate(name="Test Deck")
-    deck = service.create_deck("test_user", deck_create)
-
-    # Create a flashcard
-    flashcard_create = FlashcardCreate(deck_id=deck.id, front="Test Front", back="Test Back")
-    flashcard = service.create_flashcard("test_user", flashcard_create)
-
-    assert flashcard.id is not None
-    assert flashcard.deck_id == deck.id
-    assert flashcard.front == "Test Front"
-    assert flashcard.back == "Test Back"
-    assert flashcard.user_id == "test_user"
-
-
-def test_flashcard_service_validation_error(session: Session):
-    """Test FlashcardService raises ValidationException for invalid deck."""
-    service = FlashcardService(session)
-
-    flashcard_create = FlashcardCreate(deck_id=99999, front="Test", back="Test")
-
-    with pytest.raises(ValidationException):
-        service.create_flashcard("test_user", flashcard_create)
-
-
-def test_flashcard_service_user_isolation(session: Session):
-    """Test that users can only access their own data."""
-    service = FlashcardService(session)
-
-    # User A creates a deck
-    deck_create = DeckCreate(name="User A Deck")
-    deck = service.create_deck("user_a", deck_create)
-
-    # User B tries to access User A's deck
-    with pytest.raises(ValidationException):
-        service.get_deck(deck.id, "user_b")
+    remaining = session.exec(select(Flashcard).where(Flashcard.deck_id == deck_id)).all()
+    assert remaining == []
 
 
 # ===== Integration Tests =====
@@ -441,148 +219,148 @@ def test_flashcard_service_user_isolation(session: Session):
 def test_full_flashcard_workflow(auth_client: TestClient):  # ← Changed
     """Test complete workflow: create deck, add cards, update, delete."""
     # 1. Create a deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Japanese N5"})
+    deck_response = auth_client.post(DECKS_URL, json={"name": "Japanese N5"})
     assert deck_response.status_code == 201
     deck_id = deck_response.json()["id"]
 
     # 2. Add flashcards (using nested route)
-    card1 = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "行く", "back": "to go"}
-    ).json()
+    card1_response = auth_client.post(cards_url(deck_id), json={"front": "行く", "back": "to go"})
+    assert card1_response.status_code == 201
+    card1 = card1_response.json()
 
-    card2 = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "食べる", "back": "to eat"}
-    ).json()
-
-    # 3. Verify flashcards were added
-    cards_response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/cards")
-    assert cards_response.json()["total_count"] == 2
+    card2_response = auth_client.post(
+        cards_url(deck_id), json={"front": "食べる", "back": "to eat"}
+    )
+    assert card2_response.status_code == 201
+    card2 = card2_response.json()
 
-    # 4. Update a flashcard
+    # 3. Update a flashcard
     update_response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck_id}/cards/{card1['id']}", json={"back": "to go (updated)"}
+        card_url(deck_id, card1["id"]), json={"back": "to go (updated)"}
     )
     assert update_response.json()["back"] == "to go (updated)"
 
-    # 5. Delete a flashcard
-    delete_card_response = auth_client.delete(
-        f"/api/v1/flashcard/decks/{deck_id}/cards/{card2['id']}"
-    )
+    # 4. Delete a flashcard
+    delete_card_response = auth_client.delete(card_url(deck_id, card2["id"]))
     assert delete_card_response.status_code == 204
 
-    # 6. Verify only 1 card remains
-    cards_response = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}/cards")
+    # 5. Verify only 1 card remains
+    cards_response = auth_client.get(cards_url(deck_id))
     assert cards_response.json()["total_count"] == 1
 
-    # 7. Update deck name
+    # 6. Update deck name
     update_deck_response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck_id}", json={"name": "Japanese N5 (Updated)"}
+        deck_url(deck_id), json={"name": "Japanese N5 (Updated)"}
     )
     assert update_deck_response.json()["name"] == "Japanese N5 (Updated)"
 
-    # 8. Delete entire deck
-    delete_deck_response = auth_client.delete(f"/api/v1/flashcard/decks/{deck_id}")
+    # 7. Delete entire deck
+    delete_deck_response = auth_client.delete(deck_url(deck_id))
     assert delete_deck_response.status_code == 204
 
 
-def test_deck_flashcard_count_updates(auth_client: TestClient):  # ← Changed
+def test_deck_flashcard_count_updates(auth_client: TestClient, seed_deck_with_cards, make_cards):
     """Test that deck's flashcard_count updates correctly."""
     # Create deck
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Count Test Deck"})
-    deck_id = deck_response.json()["id"]
+    deck_id = seed_deck_with_cards("demo_user", {"name": "Count Test Deck"}, [])
 
     # Check initial count
-    deck = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}").json()
+    deck = auth_client.get(deck_url(deck_id)).json()
     assert deck["flashcard_count"] == 0
 
     # Add flashcards
-    auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "1", "back": "1"})
-    auth_client.post(f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "2", "back": "2"})
+    make_cards(deck_id, [{"front": "1", "back": "1"}, {"front": "2", "back": "2"}])
 
     # Check count after adding
-    deck = auth_client.get(f"/api/v1/flashcard/decks/{deck_id}").json()
+    deck = auth_client.get(deck_url(deck_id)).json()
     assert deck["flashcard_count"] == 2
 
 
-def test_multiple_decks_isolation(auth_client: TestClient):  # ← Changed
+def test_multiple_decks_isolation(auth_client: TestClient, seed_deck_with_cards):
     """Test that flashcards are isolated between decks."""
-    # Create two decks
-    deck1 = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 1"}).json()
-
-    deck2 = auth_client.post("/api/v1/flashcard/decks", json={"name": "Deck 2"}).json()
-
-    # Add flashcards to deck 1
-    auth_client.post(
-        f"/api/v1/flashcard/decks/{deck1['id']}/cards",
-        json={"front": "Deck 1 Card", "back": "Deck 1 Card"},
+    # Create two decks, each with its own card
+    deck1_id = seed_deck_with_cards(
+        "demo_user", {"name": "Deck 1"}, [{"front": "Deck 1 Card", "back": "Deck 1 Card"}]
     )
-
-    # Add flashcards to deck 2
-    auth_client.post(
-        f"/api/v1/flashcard/decks/{deck2['id']}/cards",
-        json={"front": "Deck 2 Card", "back": "Deck 2 Card"},
+    deck2_id = seed_deck_with_cards(
+        "demo_user", {"name": "Deck 2"}, [{"front": "Deck 2 Card", "back": "Deck 2 Card"}]
     )
 
     # Verify deck 1 has only its cards
-    deck1_cards = auth_client.get(f"/api/v1/flashcard/decks/{deck1['id']}/cards").json()
+    deck1_cards = auth_client.get(cards_url(deck1_id)).json()
     assert deck1_cards["total_count"] == 1
     assert deck1_cards["flashcards"][0]["front"] == "Deck 1 Card"
 
     # Verify deck 2 has only its cards
-    deck2_cards = auth_client.get(f"/api/v1/flashcard/decks/{deck2['id']}/cards").json()
+    deck2_cards = auth_client.get(cards_url(deck2_id)).json()
     assert deck2_cards["total_count"] == 1
     assert deck2_cards["flashcards"][0]["front"] == "Deck 2 Card"
 
 
+def test_get_decks_batch(auth_client: TestClient, seed_deck_with_cards):
+    """Test fetching several decks and their card counts in one request."""
+    deck1_id = seed_deck_with_cards(
+        "demo_user", {"name": "Deck 1"}, [{"front": "1", "back": "1"}, {"front": "2", "back": "2"}]
+    )
+    deck2_id = seed_deck_with_cards("demo_user", {"name": "Deck 2"}, [{"front": "3", "back": "3"}])
+    other_deck_id = seed_deck_with_cards("other_user_id", {"name": "Other Deck"}, [])
+
+    # Unknown IDs and other users' decks are skipped
+    response = auth_client.get(
+        f"{DECKS_URL}/batch", params={"ids": f"{deck1_id},{deck2_id},{other_deck_id},99999"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["total_count"] == 2
+    counts = {deck["id"]: deck["flashcard_count"] for deck in data["decks"]}
+    assert counts == {deck1_id: 2, deck2_id: 1}
+
+
+@pytest.mark.parametrize(
+    "ids",
+    ["1,abc", ",".join(str(i) for i in range(1, 102)), "9999999999", "1" * 5000],
+    ids=["malformed", "too_many", "out_of_range", "too_many_digits"],
+)
+def test_get_decks_batch_invalid_ids(auth_client: TestClient, ids: str):
+    """Test that a malformed, oversized or out-of-range ID list fails validation."""
+    response = auth_client.get(f"{DECKS_URL}/batch", params={"ids": ids})
+    assert response.status_code == 422
+
+
 # ===== Validation Tests =====
 
 
 def test_create_deck_empty_name(auth_client: TestClient):  # ← Changed
     """Test creating a deck with empty name fails validation."""
-    response = auth_client.post("/api/v1/flashcard/decks", json={"name": ""})
+    response = auth_client.post(DECKS_URL, json={"name": ""})
     assert response.status_code == 422
 
 
-def test_create_flashcard_empty_fields(auth_client: TestClient):  # ← Changed
+@pytest.mark.parametrize(
+    "body",
+    [{"front": "", "back": "test"}, {"front": "test", "back": ""}],
+    ids=["empty_front", "empty_back"],
+)
+def test_create_flashcard_empty_fields(
+    auth_client: TestClient, deck_id: int, body: dict
+):  # ← Changed
     """Test creating a flashcard with empty fields fails validation."""
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
-    # Empty front
-    response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "", "back": "test"}
-    )
+    response = auth_client.post(cards_url(deck_id), json=body)
     assert response.status_code == 422
 
-    # Empty back
-    response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "test", "back": ""}
-    )
-    assert response.status_code == 422
 
-
-def test_update_flashcard_long_text(auth_client: TestClient):  # ← Changed
+def test_update_flashcard_long_text(
+    auth_client: TestClient, deck_id: int, card_id: int
+):  # ← Changed
     """Test updating flashcard with very long text."""
-    deck_response = auth_client.post("/api/v1/flashcard/decks", json={"name": "Test Deck"})
-    deck_id = deck_response.json()["id"]
-
-    card_response = auth_client.post(
-        f"/api/v1/flashcard/decks/{deck_id}/cards", json={"front": "Test", "back": "Test"}
-    )
-    card_id = card_response.json()["id"]
-
     # Text within limit (1000 chars) should work
-    long_text = "a" * 1000
-    response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck_id}/cards/{card_id}", json={"back": long_text}
-    )
+    response = auth_client.put(card_url(deck_id, card_id), json={"back": _LEN_1000})
     assert response.status_code == 200
 
     # Text over limit should fail
-    too_long_text = "a" * 1001
-    response = auth_client.put(
-        f"/api/v1/flashcard/decks/{deck_id}/cards/{card_id}", json={"back": too_long_text}
-    )
+    response = auth_client.put(card_url(deck_id, card_id), json={"back": _LEN_1001})
     assert response.status_code == 422
 
 
@@ -591,5 +369,5 @@ def test_update_flashcard_long_text(auth_client: TestClient):  # ← Changed
 
 def test_flashcard_requires_auth(client: TestClient):  # ← New test
     """Test that flashcard endpoints require authentication."""
-    response = client.get("/api/v1/flashcard/decks")
+    response = client.get(DECKS_URL)
     assert response.status_code == 403
@@ -0,0 +1,73 @@
+"""Tests for the flashcard service layer."""
+
+import pytest
+from sqlmodel import Session
+
+from src.suca.core.exceptions import ValidationException
+from src.suca.schemas.flashcard_schemas import DeckCreate, FlashcardCreate
+from src.suca.services.flashcard_service import FlashcardService
+
+
+class TestFlashcardService:
+    """Tests for the FlashcardService layer."""
+
+    @pytest.fixture
+    def service(self, session: Session) -> FlashcardService:
+        """FlashcardService bound to the test's transactional session."""
+        return FlashcardService(session)
+
+    def test_create_deck(self, service: FlashcardService):
+        """Test FlashcardService create_deck method."""
+        deck_create = DeckCreate(name="Service Test Deck")
+        deck = service.create_deck("test_user", deck_create)
+
+        assert deck.id is not None
+        assert deck.name == "Service Test Deck"
+        assert deck.user_id == "test_user"
+        assert deck.flashcard_count == 0
+
+    def test_get_deck(self, service: FlashcardService):
+        """Test FlashcardService get_deck method."""
+        # Create a deck
+        deck_create = DeckCreate(name="Test Deck")
+        created_deck = service.create_deck("test_user", deck_create)
+
+        # Get the deck
+        deck = service.get_deck(created_deck.id, "test_user")
+
+        assert deck.id == created_deck.id
+        assert deck.name == "Test Deck"
+        assert deck.user_id == "test_user"
+
+    def test_create_flashcard(self, service: FlashcardService):
+        """Test FlashcardService create_flashcard method."""
+        # Create a deck first
+        deck_create = DeckCreate(name="Test Deck")
+        deck = service.create_deck("test_user", deck_create)
+
+        # Create a flashcard
+        flashcard_create = FlashcardCreate(deck_id=deck.id, front="Test Front", back="Test Back")
+        flashcard = service.create_flashcard("test_user", flashcard_create)
+
+        assert flashcard.id is not None
+        assert flashcard.deck_id == deck.id
+        assert flashcard.front == "Test Front"
+        assert flashcard.back == "Test Back"
+        assert flashcard.user_id == "test_user"
+
+    def test_validation_error(self, service: FlashcardService):
+        """Test FlashcardService raises ValidationException for invalid deck."""
+        flashcard_create = FlashcardCreate(deck_id=99999, front="Test", back="Test")
+
+        with pytest.raises(ValidationException):
+            service.create_flashcard("test_user", flashcard_create)
+
+    def test_user_isolation(self, service: FlashcardService):
+        """Test that users can only access their own data."""
+        # User A creates a deck
+        deck_create = DeckCreate(name="User A Deck")
+        deck = service.create_deck("user_a", deck_create)
+
+        # User B tries to access User A's deck
+        with pytest.raises(ValidationException):
+            service.get_deck(deck.id, "user_b")
@@ -1,15 +1,26 @@
 """Tests for search functionality."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from pydantic import ValidationError
 
+from src.suca.api.deps import get_search_service
+from src.suca.main import app
 from src.suca.schemas.search import SearchRequest, SearchResponse
 
 
-def test_search_endpoint(client: TestClient):
+@pytest.fixture(name="override_search")
+def override_search_fixture():
+    """Route the search endpoint to a Mock service for the duration of a test."""
+    mock_service = Mock()
+    app.dependency_overrides[get_search_service] = lambda: mock_service
+    yield mock_service
+    app.dependency_overrides.pop(get_search_service, None)
+
+
+def test_search_endpoint(client: TestClient, override_search: Mock):
     """Test search endpoint returns proper response format."""
     # Mock the search service to avoid SQLite incompatibility
     mock_response = SearchResponse(
@@ -20,22 +31,9 @@ def test_search_endpoint(client: TestClient):
         success=True,
     )
 
-    with patch("src.suca.api.v1.endpoints.search.SearchServiceDep"):
-        mock_service = Mock()
-        mock_service.search_entries.return_value = mock_response
-
-        # Override dependency
-        from src.suca.api.deps import get_search_service
-        from src.suca.main import app
-
-        def override_search_service():
-            return mock_service
-
-        app.dependency_overrides[get_search_service] = override_search_service
-
-        response = client.get("/api/v1/search?q=test")
+    override_search.search_entries.return_value = mock_response
 
-        app.dependency_overrides.clear()
+    response = client.get("/api/v1/search?q=test")
 
     assert response.status_code == 200
     data = response.json()
@@ -46,23 +44,25 @@ def test_search_endpoint(client: TestClient):
     assert isinstance(data["total_count"], int)
 
 
-def test_search_service_empty_query(session: Session):
-    """Test search service with empty query."""
-    from pydantic import ValidationError
-
-    # Empty query should fail at Pydantic validation level
-    with pytest.raises(ValidationError):
-        SearchRequest(query="")
-
-
 def test_search_request_validation():
     """Test search request model validation."""
-    # Valid request
     request = SearchRequest(query="test", limit=10, include_rare=False)
     assert request.query == "test"
     assert request.limit == 10
     assert request.include_rare is False
 
-    # Test with minimum length validation
-    with pytest.raises(ValueError):
-        SearchRequest(query="", limit=10)
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"query": ""},
+        {"query": "test", "limit": 0},
+        {"query": "test", "limit": 101},
+        {"query": "test", "page": 0},
+    ],
+    ids=["empty_query", "limit_too_low", "limit_too_high", "page_too_low"],
+)
+def test_search_request_invalid(kwargs: dict):
+    """Test that out-of-range search requests fail Pydantic validation."""
+    with pytest.raises(ValidationError):
+        SearchRequest(**kwargs)